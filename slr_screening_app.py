@@ -6,11 +6,21 @@
 import streamlit as st
 import requests
 import pandas as pd
-import time
+import numpy as np
+import math
+import os
+import hashlib
 from datetime import datetime
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from itertools import combinations
 import networkx as nx
+import diskcache
+
+try:
+    import igraph as ig
+except ImportError:
+    ig = None
 
 # 페이지 설정
 st.set_page_config(
@@ -19,149 +29,303 @@ st.set_page_config(
     layout="wide"
 )
 
+OPENALEX_URL = "https://api.openalex.org/works"
+MAX_PAGED_RESULTS = 10000  # page= 페이지네이션 상한
+ABSTRACT_BATCH_SIZE = 50  # 초록 조회 1회당 논문 수
+DISK_CACHE_DIR = os.environ.get("OPENALEX_CACHE_DIR", ".openalex_cache")
+DISK_CACHE_TTL = 86400  # 디스크 캐시 유지 시간 (초)
+BETWEENNESS_COST_LIMIT = 2_000_000  # 노드 수 × 간선 수가 이보다 크면 매개 중심성 샘플링
+MAX_NETWORK_AUTHORS = 50  # 저자가 이보다 많은 논문(대형 컨소시엄)은 연구자 네트워크에서 제외
+
+# OpenAlex 세션 (rerun 사이에도 연결 재사용)
+@st.cache_resource
+def get_openalex_session():
+    """keep-alive + gzip 세션 (OPENALEX_MAILTO 설정 시 polite pool 사용)"""
+    session = requests.Session()
+    session.headers.update({"User-Agent": "key-paper-helper", "Accept-Encoding": "gzip"})
+    mailto = os.environ.get("OPENALEX_MAILTO")
+    if mailto:
+        session.headers["User-Agent"] = f"key-paper-helper (mailto:{mailto})"
+        session.params = {"mailto": mailto}
+    return session
+
+# 디스크 캐시 (앱 재시작 후에도 검색 결과 유지)
+@st.cache_resource
+def get_disk_cache():
+    """OpenAlex 검색 결과 디스크 캐시"""
+    return diskcache.Cache(DISK_CACHE_DIR)
+
 # OpenAlex 검색 함수
 @st.cache_data(ttl=3600)
 def search_openalex(query, year_from, year_to, search_title=True, search_abstract=True, search_keyword=False, max_results=500):
-    """OpenAlex API 검색"""
-    BASE_URL = "https://api.openalex.org/works"
+    """OpenAlex API 검색 (메모리 캐시 → 디스크 캐시 → API 순)"""
+    disk_cache = get_disk_cache()
+    cache_key = hashlib.blake2b(
+        f"{query}|{year_from}|{year_to}|{search_title}|{search_abstract}|{search_keyword}|{max_results}".encode()
+    ).hexdigest()
+    cached = disk_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    PER_PAGE = 200
     all_results = []
-    cursor = "*"
     total_count = 0
     
     # 기본 필터
     base_filter = f"publication_year:{year_from}-{year_to}"
     
-    while len(all_results) < max_results:
-        params = {
-            "search": query,  # 기본 검색 (제목+초록+전문)
-            "filter": base_filter,
-            "per_page": 200,
-            "cursor": cursor,
-            "select": "id,doi,title,publication_year,cited_by_count,type,authorships,primary_location,abstract_inverted_index"
-        }
-        
-        # 제목만 검색하는 경우
-        if search_title and not search_abstract and not search_keyword:
-            params.pop("search", None)
-            params["filter"] = f"{base_filter},title.search:{query}"
-        # 초록만 검색하는 경우
-        elif search_abstract and not search_title and not search_keyword:
-            params.pop("search", None)
-            params["filter"] = f"{base_filter},abstract.search:{query}"
-        # 그 외는 기본 search 사용 (제목+초록 모두 검색)
-        
-        try:
-            response = requests.get(BASE_URL, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+    params = {
+        "search": query,  # 기본 검색 (제목+초록+전문)
+        "filter": base_filter,
+        "per_page": PER_PAGE,
+        "select": "id,doi,title,publication_year,cited_by_count,type,authorships,primary_location"
+    }
+    
+    # 제목만 검색하는 경우
+    if search_title and not search_abstract and not search_keyword:
+        params.pop("search", None)
+        params["filter"] = f"{base_filter},title.search:{query}"
+    # 초록만 검색하는 경우
+    elif search_abstract and not search_title and not search_keyword:
+        params.pop("search", None)
+        params["filter"] = f"{base_filter},abstract.search:{query}"
+    # 그 외는 기본 search 사용 (제목+초록 모두 검색)
+    
+    session = get_openalex_session()
+    
+    def fetch_page(page):
+        response = session.get(OPENALEX_URL, params={**params, "page": page}, timeout=30)
+        response.raise_for_status()
+        return response.json()
+    
+    try:
+        # page 방식은 10,000건까지만 지원 → 그 이상은 cursor 방식으로 순차 조회
+        if max_results > MAX_PAGED_RESULTS:
+            cursor = "*"
+            while cursor and len(all_results) < max_results:
+                response = session.get(OPENALEX_URL, params={**params, "cursor": cursor}, timeout=30)
+                response.raise_for_status()
+                data = response.json()
+                total_count = data.get("meta", {}).get("count", 0)
+                results = data.get("results", [])
+                if not results:
+                    break
+                all_results.extend(results)
+                cursor = data.get("meta", {}).get("next_cursor")
+        else:
+            # 첫 페이지로 전체 건수 확인 후 나머지 페이지는 동시에 요청
+            data = fetch_page(1)
             total_count = data.get("meta", {}).get("count", 0)
-        except Exception as e:
-            st.error(f"API 오류: {e}")
-            return [], 0
-        
-        results = data.get("results", [])
-        if not results:
-            break
+            all_results.extend(data.get("results", []))
             
-        all_results.extend(results)
-        cursor = data.get("meta", {}).get("next_cursor")
-        if not cursor:
-            break
-        
-        time.sleep(0.1)
-    
-    return all_results[:max_results], total_count
+            num_pages = min(math.ceil(max_results / PER_PAGE), math.ceil(total_count / PER_PAGE))
+            if num_pages > 1:
+                # 동시 요청 수를 4개로 제한 (OpenAlex 초당 요청 제한 준수)
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    for data in executor.map(fetch_page, range(2, num_pages + 1)):
+                        all_results.extend(data.get("results", []))
+    except Exception as e:
+        st.error(f"API 오류: {e}")
+        return [], 0
+    
+    # 오류 없이 받은 결과만 디스크에 저장
+    result = (all_results[:max_results], total_count)
+    disk_cache.set(cache_key, result, expire=DISK_CACHE_TTL)
+    return result
 
 def reconstruct_abstract(inverted_index):
     """초록 복원"""
     if not inverted_index:
         return ""
-    word_positions = []
+    # 위치가 0..N-1로 촘촘하므로 정렬 없이 위치에 바로 채움
+    n = 1 + max((pos for positions in inverted_index.values() for pos in positions), default=-1)
+    words = [""] * n
     for word, positions in inverted_index.items():
         for pos in positions:
-            word_positions.append((pos, word))
-    word_positions.sort(key=lambda x: x[0])
-    return " ".join([word for _, word in word_positions])
+            words[pos] = word
+    return " ".join([word for word in words if word])
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_abstracts(work_ids):
+    """지정한 논문의 초록만 조회 (work_ids: OpenAlex ID 튜플)
+    
+    요청 실패 시 예외를 그대로 올려 빈 결과가 캐시되지 않게 함 (호출하는 쪽에서 처리)
+    """
+    if not work_ids:
+        return {}
+    session = get_openalex_session()
+    
+    def fetch_batch(batch):
+        params = {
+            "filter": "openalex:" + "|".join(work_id.rsplit("/", 1)[-1] for work_id in batch),
+            "per_page": len(batch),
+            "select": "id,abstract_inverted_index"
+        }
+        response = session.get(OPENALEX_URL, params=params, timeout=30)
+        response.raise_for_status()
+        return response.json().get("results", [])
+    
+    # OpenAlex OR 필터는 값 개수 제한이 있으므로 나눠서 요청
+    batches = [work_ids[i:i + ABSTRACT_BATCH_SIZE] for i in range(0, len(work_ids), ABSTRACT_BATCH_SIZE)]
+    abstracts = {}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for works in executor.map(fetch_batch, batches):
+            for work in works:
+                abstracts[work["id"]] = reconstruct_abstract(work.get("abstract_inverted_index"))
+    return abstracts
+
+def results_key(results):
+    """검색 결과 캐시 키 (논문 ID + 인용 수)"""
+    return tuple((work.get("id"), work.get("cited_by_count")) for work in results)
 
+@st.cache_data(ttl=3600, show_spinner=False, hash_funcs={list: results_key})
 def process_results(results):
     """결과 처리"""
     processed = []
     for work in results:
-        authors = []
         author_names = []
         for authorship in work.get("authorships", [])[:10]:
             author = authorship.get("author", {})
             if author.get("display_name"):
-                authors.append(author["display_name"])
                 author_names.append(author["display_name"])
         
         location = work.get("primary_location", {}) or {}
         source = location.get("source", {}) or {}
         
-        # 논문 유형 분류
-        title_lower = (work.get("title", "") or "").lower()
-        work_type = work.get("type", "")
-        
-        if "review" in title_lower or "overview" in title_lower or "state-of-the-art" in title_lower:
-            paper_type = "Review"
-        elif "framework" in title_lower or "model" in title_lower or "theory" in title_lower:
-            paper_type = "Framework"
-        elif "assess" in title_lower or "evaluat" in title_lower or "measur" in title_lower or "effectiveness" in title_lower:
-            paper_type = "Eval"
-        else:
-            paper_type = "Research"
-        
         processed.append({
             "id": work.get("id", ""),
             "title": work.get("title", ""),
             "year": work.get("publication_year"),
             "cited_by_count": work.get("cited_by_count", 0),
-            "type": paper_type,
-            "authors": "; ".join(authors[:5]),
             "author_list": author_names,
+            "full_author_count": len(work.get("authorships") or []),
             "journal": source.get("display_name", ""),
-            "doi": work.get("doi", ""),
-            "abstract": reconstruct_abstract(work.get("abstract_inverted_index"))
+            "doi": work.get("doi", "")
         })
     
-    return pd.DataFrame(processed)
+    df = pd.DataFrame(processed)
+    df['authors'] = df['author_list'].str[:5].str.join('; ')
+    
+    # 논문 유형 분류 (제목 키워드 기준, 앞의 조건이 우선)
+    tl = df['title'].fillna('').str.lower()
+    df['type'] = np.select(
+        [
+            tl.str.contains('review|overview|state-of-the-art', regex=True),
+            tl.str.contains('framework|model|theory', regex=True),
+            tl.str.contains('assess|evaluat|measur|effectiveness', regex=True),
+        ],
+        ['Review', 'Framework', 'Eval'],
+        default='Research'
+    )
+    
+    return df
 
-def calculate_author_centrality(df):
-    """저자 중심성 계산"""
-    G = nx.Graph()
+@st.cache_data(ttl=3600, show_spinner=False)
+def calculate_author_centrality(author_lists):
+    """저자 중심성 계산 (author_lists: 논문별 저자 이름 튜플의 튜플)
+    
+    반환: (연결 중심성 Top 5, 매개 중심성 Top 5, 매개 중심성 샘플링 여부)
+    """
+    if ig is None:
+        return calculate_author_centrality_nx(author_lists)
+    
+    # 공저 관계 집계 (저자 이름 → 정점 번호)
+    # 공저자가 2명 이상인 논문의 저자만 등록하므로 고립 노드는 생기지 않음
+    index = {}
+    pair_counts = Counter()
+    for authors in author_lists:
+        authors = list(dict.fromkeys(authors[:5]))
+        if len(authors) < 2:
+            continue
+        ids = sorted(index.setdefault(author, len(index)) for author in authors)
+        pair_counts.update(combinations(ids, 2))
+    
+    n = len(index)
+    if n < 2:
+        return [], [], False
+    names = list(index)
+    g = ig.Graph(n=n, edges=list(pair_counts), edge_attrs={'weight': list(pair_counts.values())})
+    
+    # 연결 중심성 (nx.degree_centrality와 동일하게 n-1로 정규화)
+    degree_cent = {names[i]: d / (n - 1) for i, d in enumerate(g.degree())}
+    top_degree = sorted(degree_cent.items(), key=lambda x: x[1], reverse=True)[:5]
     
-    # 공저 관계로 네트워크 구축
-    for _, row in df.iterrows():
-        authors = row['author_list'][:5]
-        for author in authors:
-            if not G.has_node(author):
-                G.add_node(author)
+    # 매개 중심성 (nx.betweenness_centrality의 normalized=True와 동일한 스케일)
+    scale = 2 / ((n - 1) * (n - 2)) if n > 2 else 1
+    betweenness_cent = {names[i]: b * scale for i, b in enumerate(g.betweenness(directed=False))}
+    top_betweenness = sorted(betweenness_cent.items(), key=lambda x: x[1], reverse=True)[:5]
+    
+    # igraph는 C 구현이라 큰 네트워크도 정확히 계산
+    return top_degree, top_betweenness, False
+
+def calculate_author_centrality_nx(author_lists):
+    """저자 중심성 계산 (igraph 미설치 시 NetworkX 사용)"""
+    # 공저 관계 집계 후 한 번에 네트워크 구축 (간선이 있는 저자만 추가되므로 고립 노드 없음)
+    pair_counts = Counter()
+    for authors in author_lists:
+        authors = list(dict.fromkeys(authors[:5]))
         if len(authors) >= 2:
-            for pair in combinations(authors, 2):
-                if G.has_edge(pair[0], pair[1]):
-                    G[pair[0]][pair[1]]['weight'] += 1
-                else:
-                    G.add_edge(pair[0], pair[1], weight=1)
+            pair_counts.update(tuple(sorted(pair)) for pair in combinations(authors, 2))
     
-    # 고립 노드 제거
-    G.remove_nodes_from(list(nx.isolates(G)))
+    G = nx.Graph()
+    G.add_weighted_edges_from((u, v, w) for (u, v), w in pair_counts.items())
     
     if len(G.nodes()) < 2:
-        return [], []
+        return [], [], False
     
     # 연결 중심성 (Degree Centrality)
     degree_cent = nx.degree_centrality(G)
     top_degree = sorted(degree_cent.items(), key=lambda x: x[1], reverse=True)[:5]
     
-    # 매개 중심성 (Betweenness Centrality)
-    betweenness_cent = nx.betweenness_centrality(G)
+    # 매개 중심성 (Betweenness Centrality) - O(N·E)이므로 큰 네트워크는 샘플링 근사
+    sampled = G.number_of_nodes() * G.number_of_edges() > BETWEENNESS_COST_LIMIT
+    if sampled:
+        betweenness_cent = nx.betweenness_centrality(G, k=min(50, len(G)), seed=0, normalized=True)
+    else:
+        betweenness_cent = nx.betweenness_centrality(G, normalized=True)
     top_betweenness = sorted(betweenness_cent.items(), key=lambda x: x[1], reverse=True)[:5]
     
-    return top_degree, top_betweenness
+    return top_degree, top_betweenness, sampled
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def make_csv(work_ids, _df):
+    """CSV 다운로드 데이터 생성 (work_ids: 캐시 키, 전체 초록 포함)"""
+    # 초록 조회 실패 시 예외를 그대로 올려 다운로드를 실패시킴
+    # (초록이 빠진 CSV가 캐시되어 이후 다운로드에도 계속 내려가는 것을 막음)
+    abstracts = fetch_abstracts(work_ids)
+    return _df.assign(
+        abstract=_df['id'].map(abstracts).fillna('')
+    )[['title', 'year', 'cited_by_count', 'authors', 'journal', 'doi', 'abstract']].to_csv(index=False).encode('utf-8-sig')
 
 # 현재 연도
 current_year = datetime.now().year
 
+# 빠른 선택 체크박스 key → 기간(년)
+QUICK_RANGES = {"last_5y": 5, "last_10y": 10, "last_15y": 15}
+
+def apply_quick_range(selected):
+    """빠른 선택 체크 시 출판 기간 위젯 값을 바로 변경"""
+    if not st.session_state[selected]:
+        return
+    for key in QUICK_RANGES:
+        if key != selected:
+            st.session_state[key] = False
+    st.session_state.year_from = current_year - QUICK_RANGES[selected]
+    st.session_state.year_to = current_year
+
+def clear_quick_ranges():
+    """출판 기간을 직접 바꾸면 빠른 선택 체크 해제"""
+    for key in QUICK_RANGES:
+        st.session_state[key] = False
+
+# 연도 선택지와 기본 기간은 세션당 한 번만 생성
+if "year_from_options" not in st.session_state:
+    st.session_state.year_from_options = list(range(current_year, 1969, -1))
+    st.session_state.year_to_options = list(range(current_year, 1999, -1))
+if "year_from" not in st.session_state:
+    st.session_state.year_from = current_year - 10
+    st.session_state.year_to = current_year
+
 # ==================== 사이드바 ====================
 with st.sidebar:
     st.markdown("### 🔑 Key-Paper Helper")
@@ -191,30 +355,25 @@ with st.sidebar:
     with col1:
         year_from = st.selectbox(
             "시작",
-            options=list(range(current_year, 1969, -1)),
-            index=10,
+            options=st.session_state.year_from_options,
+            key="year_from",
+            on_change=clear_quick_ranges,
             label_visibility="collapsed"
         )
     with col2:
         year_to = st.selectbox(
             "종료", 
-            options=list(range(current_year, 1999, -1)),
-            index=0,
+            options=st.session_state.year_to_options,
+            key="year_to",
+            on_change=clear_quick_ranges,
             label_visibility="collapsed"
         )
     
-    # 빠른 선택
+    # 빠른 선택 (체크하면 위 출판 기간 값을 바꿈)
     st.caption("빠른 선택:")
-    last_5y = st.checkbox("최근 5년", value=False)
-    last_10y = st.checkbox("최근 10년", value=False)
-    last_15y = st.checkbox("최근 15년", value=False)
-    
-    if last_5y:
-        year_from, year_to = current_year - 5, current_year
-    elif last_10y:
-        year_from, year_to = current_year - 10, current_year
-    elif last_15y:
-        year_from, year_to = current_year - 15, current_year
+    st.checkbox("최근 5년", key="last_5y", on_change=apply_quick_range, args=("last_5y",))
+    st.checkbox("최근 10년", key="last_10y", on_change=apply_quick_range, args=("last_10y",))
+    st.checkbox("최근 15년", key="last_15y", on_change=apply_quick_range, args=("last_15y",))
     
     st.markdown("---")
     
@@ -231,19 +390,47 @@ with st.sidebar:
 
 # ==================== 메인 영역 ====================
 
-if search_button and search_query.strip():
-    with st.spinner(f"📚 '{search_query}' 관련 논문을 찾는 중..."):
-        results, total_count = search_openalex(
-            search_query, year_from, year_to,
-            search_title=search_title,
-            search_abstract=search_abstract,
-            search_keyword=search_keyword,
-            max_results=500
-        )
+if (search_button and search_query.strip()) or (not search_button and "results" in st.session_state):
+    if search_button:
+        with st.spinner(f"📚 '{search_query}' 관련 논문을 찾는 중..."):
+            results, total_count = search_openalex(
+                search_query, year_from, year_to,
+                search_title=search_title,
+                search_abstract=search_abstract,
+                search_keyword=search_keyword,
+                max_results=500
+            )
+        # 사이드바 조작 등으로 rerun 되어도 마지막 검색 결과를 다시 보여주기 위해 저장
+        if results:
+            st.session_state.results = results
+            st.session_state.query_meta = (search_query, year_from, year_to, total_count)
+        else:
+            st.session_state.pop("results", None)
+            st.session_state.pop("query_meta", None)
+    else:
+        results = st.session_state.results
     
     if results:
+        shown_query, shown_from, shown_to, total_count = st.session_state.query_meta
+        
         df = process_results(results)
         df_sorted = df.sort_values('cited_by_count', ascending=False)
+        top10_df = df.nlargest(10, 'cited_by_count')
+        try:
+            abstracts = fetch_abstracts(tuple(top10_df['id']))
+        except Exception as e:
+            st.error(f"초록 조회 오류: {e}")
+            abstracts = {}
+        
+        # 상세 정보에 표시할 문자열을 한 번에 계산
+        doi = top10_df['doi'].fillna('')
+        authors = top10_df['authors']
+        abstract = top10_df['id'].map(abstracts).fillna('')
+        top10_df = top10_df.assign(
+            doi_url=np.where(doi.eq('') | doi.str.startswith('http'), doi, 'https://doi.org/' + doi),
+            authors_short=np.where(authors.str.len() > 150, authors.str.slice(0, 150) + '...', authors),
+            abstract_short=np.where(abstract.str.len() > 600, abstract.str.slice(0, 600) + '...', abstract)
+        )
         
         # 헤더
         st.markdown(f"""
@@ -251,7 +438,7 @@ if search_button and search_query.strip():
             🔑 Key-Paper Helper
         </h1>
         <h2 style="font-size: 1.8rem; color: #555; text-align: center; margin-top: 0.5rem; margin-bottom: 1.5rem; font-weight: normal;">
-            '{search_query}' 검색 결과 ({year_from}-{year_to}) | 총 {total_count:,}건
+            '{shown_query}' 검색 결과 ({shown_from}-{shown_to}) | 총 {total_count:,}건
         </h2>
         """, unsafe_allow_html=True)
         
@@ -265,19 +452,19 @@ if search_button and search_query.strip():
             with col_title:
                 st.markdown("### ⭐ 필독 논문 Top 10")
             with col_download:
-                csv_data = df_sorted[['title', 'year', 'cited_by_count', 'authors', 'journal', 'doi', 'abstract']].to_csv(index=False).encode('utf-8-sig')
+                # 버튼을 눌렀을 때만 CSV 생성 (초록 조회 실패 시 다운로드 실패)
                 st.download_button(
                     "📥 전체 다운로드",
-                    data=csv_data,
-                    file_name=f"KeyPaper_{search_query[:15].replace(' ', '_')}.csv",
+                    data=lambda: make_csv(tuple(df_sorted['id']), df_sorted),
+                    file_name=f"KeyPaper_{shown_query[:15].replace(' ', '_')}.csv",
                     mime="text/csv",
                     help="검색된 전체 논문 데이터를 CSV 파일로 다운로드합니다. (제목, 연도, 인용수, 저자, 저널, DOI, 초록 포함)"
                 )
             
-            top10 = df_sorted.head(10).copy()
+            top10 = top10_df.copy()
             top10['순위'] = range(1, len(top10) + 1)
             top10['인용'] = top10['cited_by_count'].apply(lambda x: f"{x:,}회")
-            top10['논문'] = top10.apply(lambda r: f"{r['title']} ({r['year']})", axis=1)
+            top10['논문'] = top10['title'].astype(str) + " (" + top10['year'].astype(str) + ")"
             
             # 테이블 표시
             st.dataframe(
@@ -295,28 +482,31 @@ if search_button and search_query.strip():
             
             # 상세 정보
             st.markdown("#### 📄 상세 정보")
-            for i, (_, row) in enumerate(df_sorted.head(10).iterrows(), 1):
-                with st.expander(f"**{i}. {row['title']}** ({row['cited_by_count']:,}회 인용)"):
+            for i, row in enumerate(top10_df.itertuples(index=False), 1):
+                with st.expander(f"**{i}. {row.title}** ({row.cited_by_count:,}회 인용)"):
                     # DOI 링크
-                    if row['doi']:
-                        doi_url = row['doi'] if row['doi'].startswith('http') else f"https://doi.org/{row['doi']}"
-                        st.markdown(f"🔗 **[논문 바로가기]({doi_url})**")
+                    if row.doi_url:
+                        st.markdown(f"🔗 **[논문 바로가기]({row.doi_url})**")
                     
                     st.markdown(f"""
-                    - 📅 **출판연도:** {row['year']}년
-                    - 📖 **저널:** {row['journal'] if row['journal'] else 'N/A'}
-                    - 👥 **저자:** {row['authors'][:150]}{'...' if len(row['authors']) > 150 else ''}
+                    - 📅 **출판연도:** {row.year}년
+                    - 📖 **저널:** {row.journal if row.journal else 'N/A'}
+                    - 👥 **저자:** {row.authors_short}
                     """)
-                    if row['abstract']:
+                    if row.abstract_short:
                         st.markdown("**📝 초록:**")
-                        st.write(row['abstract'][:600] + "..." if len(row['abstract']) > 600 else row['abstract'])
+                        st.write(row.abstract_short)
         
         # ========== 탭 2: 핵심 연구자 ==========
         with tab2:
             st.markdown("### 👥 핵심 연구자 (Key Players)")
             
             with st.spinner("연구자 네트워크 분석 중..."):
-                top_degree, top_betweenness = calculate_author_centrality(df_sorted)
+                top_degree, top_betweenness, betweenness_sampled = calculate_author_centrality(
+                    tuple(map(tuple, df_sorted.loc[
+                        df_sorted['full_author_count'] <= MAX_NETWORK_AUTHORS, 'author_list'
+                    ].values))
+                )
             
             if top_degree:
                 col1, col2 = st.columns(2)
@@ -334,6 +524,8 @@ if search_button and search_query.strip():
                 with col2:
                     st.markdown("#### 🌉 매개 중심성 Top 5")
                     st.caption("네트워크 연결자 역할")
+                    if betweenness_sampled:
+                        st.caption("※ 연구자 네트워크가 커서 일부 연구자를 표본으로 계산한 근사값입니다.")
                     
                     between_df = pd.DataFrame([
                         {"순위": i+1, "연구자": name, "중심성": f"{score:.3f}"}
@@ -355,8 +547,8 @@ if search_button and search_query.strip():
             st.markdown("### 📚 주요 저널")
             
             # 저널별 논문 수 집계
-            journal_counts = df_sorted['journal'].value_counts().head(15)
-            journal_counts = journal_counts[journal_counts.index != '']  # 빈 저널 제외
+            # 빈 저널을 먼저 제외해야 head(15)가 실제 저널 15개를 고름
+            journal_counts = df.loc[df['journal'].ne('') & df['journal'].notna(), 'journal'].value_counts().head(15)
             
             if len(journal_counts) > 0:
                 journal_df = pd.DataFrame({